@@ -21,7 +21,9 @@ def main() -> None:
     console.print()
 
     required_vars = ['TELEGRAM_API_ID', 'TELEGRAM_API_HASH', 'TELEGRAM_BOT_TOKEN', 'TELEGRAM_CHANNEL_ID']
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    # Read each variable once (after load_dotenv) and reuse the snapshot below.
+    env = {var: os.getenv(var) for var in required_vars}
+    missing_vars = [var for var, value in env.items() if not value]
     if missing_vars:
         console.print("[bold red]✗ Missing required environment variables:[/bold red]")
         for var in missing_vars:
@@ -39,8 +41,8 @@ def main() -> None:
         ))
 
     # Safe to call int() — missing_vars check above guarantees these are non-empty.
-    bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-    channel_id = int(os.getenv('TELEGRAM_CHANNEL_ID'))
+    bot_token = env['TELEGRAM_BOT_TOKEN']
+    channel_id = int(env['TELEGRAM_CHANNEL_ID'])
 
     cookies_file = None
     while True:
@@ -64,20 +66,26 @@ def main() -> None:
 
     console.print()
     downloader = YouTubeTelegramDownloader(cookies_file)
-    uploader = TelegramUploader(bot_token, channel_id)
+    uploader = TelegramUploader(bot_token, channel_id, env['TELEGRAM_API_ID'], env['TELEGRAM_API_HASH'])
 
     # Main interactive loop: each iteration is one full single/playlist/batch session.
     # Cookies (above) are answered once per program run and reused across iterations.
-    while True:
-        try:
-            run_session(downloader, uploader)
-        except KeyboardInterrupt:
-            console.print("\n[yellow]⚠ Current operation cancelled. Returning to mode menu.[/yellow]")
-        except Exception as e:
-            console.print(f"[red]✗ Unexpected error: {e}[/red]")
+    try:
+        while True:
+            try:
+                run_session(downloader, uploader)
+            except KeyboardInterrupt:
+                console.print("\n[yellow]⚠ Current operation cancelled. Returning to mode menu.[/yellow]")
+            except Exception as e:
+                console.print(f"[red]✗ Unexpected error: {e}[/red]")
 
-        if not prompt_continue():
-            break
+            if not prompt_continue():
+                break
+    finally:
+        try:
+            uploader.close()
+        finally:
+            downloader.close()
 
     console.print("[bold green]Done![/bold green]")
 
@@ -16,6 +16,15 @@ class Config:
     valid_containers: Tuple[str, ...] = ('mp4', 'mkv', 'webm')
     concurrent_fragment_downloads: int = 10
 
+    # Playlist/batch: formats are fetched a few entries ahead, this many at a time.
+    # Kept low so YouTube does not start rate-limiting the session.
+    metadata_workers: int = 4
+
+    # In-memory cache of extracted video metadata (entries, seconds). YouTube's
+    # signed stream URLs expire after a few hours, so keep the TTL well below that.
+    info_cache_size: int = 64
+    info_cache_ttl_sec: int = 1800
+
     # Size limits (MB)
     default_max_size_mb: int = 2048
 
@@ -1,11 +1,18 @@
 import os
+import re
 import shutil
 import logging
-from typing import Optional, Dict, List, Union
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import urlsplit
 import yt_dlp
 
 from src.models import ParsedVideoFormat, ParsedAudioFormat, VideoInfo, DownloadResult
 from src.config import config
+from src.utils.helpers import find_sibling_files, remove_sibling_files
 
 
 # Module-level cache for the detected JS runtime's yt-dlp opts.
@@ -40,6 +47,43 @@ def _detect_js_runtime() -> dict:
     return _JS_RUNTIME_OPTS
 
 
+_BYTES_PER_MB = 1024 * 1024
+
+# Thumbnail extensions yt-dlp may write, in order of preference.
+_THUMBNAIL_EXTS = ('webp', 'jpg', 'png')
+
+# Video codec preference for equal resolution/fps: avc1/h264 > av01 > vp9 (lower wins).
+_CODEC_PRIORITY = {'avc1': 0, 'h264': 0, 'av01': 1, 'vp9': 2, 'vp09': 2}
+
+# yt-dlp reads the cookie file when an instance first needs it and rewrites it in
+# place on close(). Playlist/batch mode runs several instances from worker threads,
+# so both steps are serialised to keep one instance from reading a half-written file.
+_COOKIE_LOCK = threading.Lock()
+
+# One pass over the URL finds the video ID in watch, youtu.be, embed, shorts and live links.
+_VIDEO_ID_RE = re.compile(r'(?:[?&]v=|youtu\.be/|/embed/|/shorts/|/live/|/v/)([\w-]{11})(?![\w-])')
+
+
+_YOUTUBE_HOSTS = frozenset({
+    'youtube.com', 'www.youtube.com', 'm.youtube.com', 'music.youtube.com', 'youtu.be',
+})
+
+
+def _info_cache_key(url: str) -> str:
+    """
+    Canonical _extract_info cache key: the video ID, so the different link forms
+    of one video share an entry. Only YouTube links are keyed by ID (other sites
+    use similar paths for their own IDs); URLs carrying a playlist (list=)
+    extract differently and keep their own key too.
+    """
+    host = urlsplit(url if '//' in url else '//' + url).hostname or ''
+    if host in _YOUTUBE_HOSTS and 'list=' not in url:
+        match = _VIDEO_ID_RE.search(url)
+        if match:
+            return match.group(1)
+    return url
+
+
 class YouTubeTelegramDownloader:
     def __init__(self, cookies_file: Optional[str] = None):
         """
@@ -47,13 +91,21 @@ class YouTubeTelegramDownloader:
         
         :param cookies_file: Optional path to Netscape-format cookie file
         """
+        self.logger = logging.getLogger(__name__)
+        
         self.cookies_file = None
         if cookies_file and os.path.exists(cookies_file):
             self.cookies_file = cookies_file
         elif cookies_file:
-            logging.warning(f"Cookie file {cookies_file} not found")
+            self.logger.warning(f"Cookie file {cookies_file} not found")
         
-        self.logger = logging.getLogger(__name__)
+        # Idle metadata-only YoutubeDL instances, keyed by their options (see _pooled_ydl).
+        self._idle_ydls: Dict[str, List[yt_dlp.YoutubeDL]] = {}
+        self._pool_lock = threading.Lock()
+        
+        # Raw metadata from _extract_info keyed by video ID (see _info_cache_key), least recently used first.
+        self._info_cache: 'OrderedDict[str, Tuple[float, dict]]' = OrderedDict()
+        self._info_cache_lock = threading.Lock()
 
     def _base_opts(self, **extra) -> dict:
         """
@@ -69,6 +121,128 @@ class YouTubeTelegramDownloader:
         opts.update(extra)
         return opts
 
+    def _new_ydl(self, ydl_opts: dict) -> yt_dlp.YoutubeDL:
+        with _COOKIE_LOCK:
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            if self.cookies_file:
+                ydl.cookiejar  # load cookies now, under the lock
+        return ydl
+
+    @contextmanager
+    def _open_ydl(self, ydl_opts: dict):
+        """
+        Context manager yielding a fresh YoutubeDL instance that is safe to use
+        from worker threads (see _COOKIE_LOCK). Used for downloads, whose options
+        (format, hooks) differ on every call.
+        """
+        ydl = self._new_ydl(ydl_opts)
+        try:
+            yield ydl
+        finally:
+            with _COOKIE_LOCK:
+                ydl.close()
+
+    @contextmanager
+    def _pooled_ydl(self, **extra):
+        """
+        Context manager yielding a long-lived YoutubeDL for download=False extraction.
+        
+        Building an instance sets up extractors, the cookie jar and the HTTP request
+        director; pooling lets metadata calls reuse all of that (including open
+        connections) instead of paying for it per URL. Instances are not thread-safe,
+        so each caller borrows one exclusively and returns it afterwards; the pool
+        grows only to the number of concurrent callers. Options are part of the key,
+        so a JS runtime installed mid-run still gets a new instance. close() releases
+        everything.
+        
+        Download instances rewrite the cookie file after every download, so a pooled
+        jar reloads the file when borrowed and saves it when returned, just as a fresh
+        instance per call would; a jar held since creation would overwrite newer cookies.
+        """
+        ydl_opts = self._base_opts(**extra)
+        key = repr(sorted(ydl_opts.items()))
+        with self._pool_lock:
+            idle = self._idle_ydls.setdefault(key, [])
+            ydl = idle.pop() if idle else None
+        reused = ydl is not None
+        if not reused:
+            ydl = self._new_ydl(ydl_opts)
+        jar_synced = False
+        try:
+            if reused and self.cookies_file:
+                with _COOKIE_LOCK:
+                    self._reload_cookies(ydl)
+            jar_synced = True
+            yield ydl
+        finally:
+            # A jar whose reload failed may be empty; saving it would wipe the file.
+            if self.cookies_file and jar_synced:
+                with _COOKIE_LOCK:
+                    ydl.save_cookies()
+            with self._pool_lock:
+                self._idle_ydls[key].append(ydl)
+
+    @staticmethod
+    def _reload_cookies(ydl: yt_dlp.YoutubeDL) -> None:
+        """Replace ydl's cookie jar contents with the file's. Call with _COOKIE_LOCK held."""
+        jar = ydl.cookiejar
+        jar.clear()
+        jar.load()
+
+    def close(self) -> None:
+        """Close pooled YoutubeDL instances. Call once at exit."""
+        with self._pool_lock:
+            pooled = [ydl for idle in self._idle_ydls.values() for ydl in idle]
+            self._idle_ydls.clear()
+        for ydl in pooled:
+            with _COOKIE_LOCK:
+                # Their cookies were saved when returned to the pool; reload first so
+                # close() writes back the current file instead of an older jar.
+                if self.cookies_file:
+                    self._reload_cookies(ydl)
+                ydl.close()
+
+    def _extract_info(self, url: str) -> dict:
+        """
+        Metadata-only extract_info with a small in-memory LRU cache.
+        
+        A URL is often resolved more than once per run (the first batch URL for the
+        format menu and again for its own download, retries, repeated sessions), and
+        each extraction costs several YouTube round trips plus player JS work.
+        Entries expire after config.info_cache_ttl_sec since the signed stream URLs
+        inside them do too.
+        """
+        info = self._cached_info(url)
+        if info is not None:
+            return info
+        
+        now = time.monotonic()
+        with self._pooled_ydl(quiet=True, no_warnings=True) as ydl:
+            info = ydl.extract_info(url, download=False)
+        
+        key = _info_cache_key(url)
+        with self._info_cache_lock:
+            self._info_cache[key] = (now, info)
+            self._info_cache.move_to_end(key)
+            while len(self._info_cache) > config.info_cache_size:
+                self._info_cache.popitem(last=False)
+        return info
+
+    def _cached_info(self, url: str) -> Optional[dict]:
+        """Return unexpired metadata cached by _extract_info for url, or None."""
+        key = _info_cache_key(url)
+        with self._info_cache_lock:
+            cached = self._info_cache.get(key)
+            if cached and time.monotonic() - cached[0] < config.info_cache_ttl_sec:
+                self._info_cache.move_to_end(key)
+                return cached[1]
+        return None
+
+    def _forget_info(self, url: str) -> None:
+        """Drop url's cached metadata so the next call extracts it again."""
+        with self._info_cache_lock:
+            self._info_cache.pop(_info_cache_key(url), None)
+
     @staticmethod
     def check_js_runtime() -> bool:
         """Check if a supported JS runtime (node or deno) is installed."""
@@ -90,92 +264,90 @@ class YouTubeTelegramDownloader:
         """
 
         
-        ydl_opts = self._base_opts(quiet=True, no_warnings=True)
-        
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+            info = self._extract_info(url)
+            
+            raw_video: List[ParsedVideoFormat] = []
+            raw_audio: List[ParsedAudioFormat] = []
+            
+            for fmt in info.get('formats', []):
+                get = fmt.get  # bound once; each format needs ~10 lookups
+                vcodec = get('vcodec', 'none')
+                acodec = get('acodec', 'none')
+                if vcodec == 'none' and acodec == 'none':
+                    continue  # storyboards / images
+
+                # Video-only or video+audio streams
+                if vcodec != 'none':
+                    resolution = get('height', 0)
+                    if resolution == 0:
+                        continue
                 
-                raw_video: List[ParsedVideoFormat] = []
-                raw_audio: List[ParsedAudioFormat] = []
+                filesize = get('filesize') or get('filesize_approx', 0) or 0
+                size_mb = round(filesize / _BYTES_PER_MB, 1) if filesize else 0
                 
-                for fmt in info.get('formats', []):
-                    vcodec = fmt.get('vcodec', 'none')
-                    acodec = fmt.get('acodec', 'none')
-                    
-                    # Video-only or video+audio streams
-                    if vcodec != 'none':
-                        resolution = fmt.get('height', 0)
-                        if resolution == 0:
-                            continue
-                        fps = fmt.get('fps', 0) or 0
-                        filesize = fmt.get('filesize') or fmt.get('filesize_approx', 0) or 0
-                        size_mb = filesize / (1024 * 1024) if filesize else 0
-                        raw_video.append({
-                            'format_id': fmt['format_id'],
-                            'resolution': resolution,
-                            'fps': fps,
-                            'ext': fmt.get('ext', '?'),
-                            'vcodec': vcodec.split('.')[0],  # e.g. 'avc1.64001f' -> 'avc1'
-                            'size_mb': round(size_mb, 1),
-                            'format_note': fmt.get('format_note', ''),
-                            'dynamic_range': fmt.get('dynamic_range', 'SDR') or 'SDR',
-                            'is_progressive': acodec != 'none',
-                        })
-                    
+                if vcodec != 'none':
+                    raw_video.append({
+                        'format_id': fmt['format_id'],
+                        'resolution': resolution,
+                        'fps': get('fps', 0) or 0,
+                        'ext': get('ext', '?'),
+                        'vcodec': vcodec.split('.')[0],  # e.g. 'avc1.64001f' -> 'avc1'
+                        'size_mb': size_mb,
+                        'format_note': get('format_note', ''),
+                        'dynamic_range': get('dynamic_range', 'SDR') or 'SDR',
+                        'is_progressive': acodec != 'none',
+                    })
+                else:
                     # Audio-only streams
-                    if acodec != 'none' and vcodec == 'none':
-                        filesize = fmt.get('filesize') or fmt.get('filesize_approx', 0) or 0
-                        size_mb = filesize / (1024 * 1024) if filesize else 0
-                        raw_audio.append({
-                            'format_id': fmt['format_id'],
-                            'bitrate': fmt.get('abr', 0) or 0,
-                            'ext': fmt.get('ext', '?'),
-                            'acodec': acodec.split('.')[0],
-                            'size_mb': round(size_mb, 1),
-                            'format_note': fmt.get('format_note', ''),
-                        })
-                
-                # Sort video (descending via reverse=True):
-                #   1. resolution  — highest first
-                #   2. fps         — highest first
-                #   3. codec pref  — avc1/h264 > av01 > vp9 (negated so lower number wins)
-                #   4. known size  — True (known) sorts above False (unknown)
-                #   5. size_mb     — larger first
-                codec_priority = {'avc1': 0, 'h264': 0, 'av01': 1, 'vp9': 2, 'vp09': 2}
-                video_formats = sorted(
-                    raw_video,
-                    key=lambda f: (
-                        f['resolution'],
-                        f['fps'],
-                        -codec_priority.get(f['vcodec'], 99),
-                        f['size_mb'] > 0,
-                        f['size_mb'],
-                    ),
-                    reverse=True,
-                )
-                
-                # Sort audio: KNOWN bitrate first, then highest bitrate
-                audio_formats = sorted(
-                    raw_audio,
-                    key=lambda f: (f['bitrate'] > 0, f['bitrate']),
-                    reverse=True
+                    raw_audio.append({
+                        'format_id': fmt['format_id'],
+                        'bitrate': get('abr', 0) or 0,
+                        'ext': get('ext', '?'),
+                        'acodec': acodec.split('.')[0],
+                        'size_mb': size_mb,
+                        'format_note': get('format_note', ''),
+                    })
+            
+            # Sort video (descending via reverse=True):
+            #   1. resolution  — highest first
+            #   2. fps         — highest first
+            #   3. codec pref  — avc1/h264 > av01 > vp9 (negated so lower number wins)
+            #   4. known size  — True (known) sorts above False (unknown)
+            #   5. size_mb     — larger first
+            video_formats = sorted(
+                raw_video,
+                key=lambda f: (
+                    f['resolution'],
+                    f['fps'],
+                    -_CODEC_PRIORITY.get(f['vcodec'], 99),
+                    f['size_mb'] > 0,
+                    f['size_mb'],
+                ),
+                reverse=True,
+            )
+            
+            # Sort audio: KNOWN bitrate first, then highest bitrate
+            audio_formats = sorted(
+                raw_audio,
+                key=lambda f: (f['bitrate'] > 0, f['bitrate']),
+                reverse=True
+            )
+            
+            if not video_formats:
+                raise RuntimeError(
+                    "No video formats found. This usually means yt-dlp is outdated. "
+                    "Run 'pip install -U yt-dlp' to update."
                 )
-                
-                if not video_formats:
-                    raise RuntimeError(
-                        "No video formats found. This usually means yt-dlp is outdated. "
-                        "Run 'pip install -U yt-dlp' to update."
-                    )
-                
-                return {
-                    'video_formats': video_formats,
-                    'audio_formats': audio_formats,
-                    'title': info.get('title', 'Unknown Title'),
-                    'duration': info.get('duration', 0),
-                    'thumbnail': info.get('thumbnail')
-                }
             
+            return {
+                'video_formats': video_formats,
+                'audio_formats': audio_formats,
+                'title': info.get('title', 'Unknown Title'),
+                'duration': info.get('duration', 0),
+                'thumbnail': info.get('thumbnail')
+            }
+        
         except yt_dlp.utils.DownloadError as e:
             self.logger.error(f"Download error: {e}")
             raise RuntimeError(f"Failed to extract video info: {e}") from e
@@ -203,7 +375,9 @@ class YouTubeTelegramDownloader:
         
         ydl_opts = self._base_opts(
             format=f'{video_format}+{audio_format}' if audio_format else video_format,
-            outtmpl='%(title)s.%(ext)s',
+            # Video ID keeps titles unique on disk: playlist/batch mode downloads the
+            # next entry while the previous one is still uploading.
+            outtmpl='%(title)s [%(id)s].%(ext)s',
             writethumbnail=True,
             quiet=True,
             no_warnings=True,
@@ -216,21 +390,21 @@ class YouTubeTelegramDownloader:
             ydl_opts['progress_hooks'] = [progress_hook]
         
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info_dict = ydl.extract_info(url, download=True)
+            with self._open_ydl(ydl_opts) as ydl:
+                info_dict = self._download_info(ydl, url)
                 video_filename = ydl.prepare_filename(info_dict)
                 
-                base_filename = video_filename.rsplit('.', 1)[0]
+                base_filename = os.path.splitext(video_filename)[0]
                 video_filename = f"{base_filename}.{container_format}"
                 
                 if not os.path.exists(video_filename):
                     raise FileNotFoundError(f"Downloaded video file not found: {video_filename}")
                 
-                base_name = base_filename
+                thumbnails = find_sibling_files(base_filename, _THUMBNAIL_EXTS)
                 thumbnail_path = next(
-                    (f"{base_name}.{ext}" for ext in ['webp', 'jpg', 'png'] 
-                    if os.path.exists(f"{base_name}.{ext}"))
-                , None)
+                    (thumbnails[ext] for ext in _THUMBNAIL_EXTS if ext in thumbnails),
+                    None,
+                )
                 
                 return DownloadResult(
                     video_path=video_filename,
@@ -243,18 +417,52 @@ class YouTubeTelegramDownloader:
             self.logger.error(f"Download failed: {e}")
             raise RuntimeError(f"Failed to download video: {e}") from e
 
+    def _download_info(self, ydl: yt_dlp.YoutubeDL, url: str) -> dict:
+        """
+        Download url with ydl, reusing the metadata get_video_qualities already
+        extracted when it is still cached. This skips a second round of webpage,
+        player JS and API requests, the same way yt-dlp's --load-info-json does,
+        including its fallback to a fresh extraction if the cached info fails
+        (e.g. stream URLs rejected by YouTube).
+        
+        Metadata is extracted first even on a cache miss, so the output name is known
+        up front: if the download fails or is cancelled, the thumbnail and .part files
+        it already wrote are removed.
+        
+        :return: The processed info dict, as extract_info(download=True) returns it
+        """
+        cached = self._cached_info(url)
+        info = cached if cached is not None else self._extract_info(url)
+        if info.get('_type', 'video') != 'video':
+            return ydl.extract_info(url, download=True)
+        
+        base_filename = os.path.splitext(ydl.prepare_filename(info))[0]
+        try:
+            try:
+                # sanitize_info returns a fresh copy; the cached dict is shared between threads.
+                return ydl.process_ie_result(ydl.sanitize_info(dict(info), remove_private_keys=True), download=True)
+            except yt_dlp.utils.DownloadError as e:
+                if cached is None:
+                    raise  # freshly extracted; extracting again would not help
+                self.logger.warning(f"Download from cached info failed, extracting again: {e}")
+                self._forget_info(url)
+                return ydl.extract_info(url, download=True)
+        except BaseException:
+            remove_sibling_files(base_filename)
+            raise
+
     def is_playlist(self, url: str) -> bool:
         """
         Check if the URL is a YouTube playlist with more than one video.
-        Uses flat extraction for instant detection.
+        Uses flat extraction for instant detection. yt-dlp yields playlist entries
+        lazily, so capping the slice at two entries means only the first page is
+        fetched instead of the whole playlist (get_playlist_entries reads it all).
         
         :param url: YouTube URL
         :return: True if playlist
         """
-        ydl_opts = self._base_opts(quiet=True, no_warnings=True, extract_flat=True)
-        
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._pooled_ydl(quiet=True, no_warnings=True, extract_flat=True, playlistend=2) as ydl:
                 info = ydl.extract_info(url, download=False)
                 entries = info.get('entries', [])
                 return bool(entries and len(entries) > 1)
@@ -269,14 +477,12 @@ class YouTubeTelegramDownloader:
         :return: List of {'title': str, 'url': str}
         :raises RuntimeError: If extraction fails
         """
-        ydl_opts = self._base_opts(
-            quiet=True,
-            no_warnings=True,
-            extract_flat=True,  # Faster extraction without full video info
-        )
-        
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            with self._pooled_ydl(
+                quiet=True,
+                no_warnings=True,
+                extract_flat=True,  # Faster extraction without full video info
+            ) as ydl:
                 info = ydl.extract_info(url, download=False)
                 entries = info.get('entries', [])
                 if not entries:
@@ -299,6 +505,14 @@ class YouTubeTelegramDownloader:
             self.logger.error(f"Unexpected error extracting playlist: {e}")
             raise RuntimeError(f"Failed to extract playlist: {e}") from e
 
+    @staticmethod
+    def same_video(url_a: str, url_b: str) -> bool:
+        """
+        Whether two URLs point at the same video (e.g. youtu.be/X and watch?v=X).
+        Such entries download to the same file name.
+        """
+        return _info_cache_key(url_a) == _info_cache_key(url_b)
+
     @staticmethod
     def estimate_size(video_formats: list, audio_formats: list, video_format_id: str, audio_format_id: Optional[str] = None) -> float:
         """
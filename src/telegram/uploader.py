@@ -1,5 +1,5 @@
 import os
-import time
+import asyncio
 import logging
 from typing import Union, Optional, Callable
 from pyrogram import Client
@@ -8,68 +8,126 @@ from pyrogram.errors import FloodWait
 from src.models import DownloadResult
 from src.config import config
 
+# uvloop is optional (and unavailable on Windows); the stdlib loop is used without it.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 class TelegramUploader:
-    def __init__(self, bot_token: str, channel_id: Union[str, int]):
+    def __init__(self, bot_token: str, channel_id: Union[str, int], api_id: str, api_hash: str):
         """
         Initialize the Telegram uploader with bot credentials.
         
         :param bot_token: Telegram bot token
         :param channel_id: Telegram channel ID (can be string username or integer ID)
+        :param api_id: Telegram API ID (TELEGRAM_API_ID)
+        :param api_hash: Telegram API hash (TELEGRAM_API_HASH)
         """
         if not bot_token or not isinstance(bot_token, str):
             raise ValueError("Bot token must be a non-empty string")
+        if not api_id or not api_hash:
+            raise ValueError("API ID and API hash must be non-empty")
         
         self.channel_id = channel_id
         
-        api_id = os.getenv('TELEGRAM_API_ID')
-        api_hash = os.getenv('TELEGRAM_API_HASH')
-        
-        if not api_id or not api_hash:
-            raise ValueError("TELEGRAM_API_ID and TELEGRAM_API_HASH must be set in environment variables")
-        
+        # The client is asyncio-only. It gets a loop of its own, which the sync
+        # methods below drive from the calling thread.
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
         self.app = Client(
             "youtube_downloader_bot",
             bot_token=bot_token,
             api_id=api_id,
-            api_hash=api_hash
+            api_hash=api_hash,
+            loop=self._loop
         )
         self._started = False
         
         self.logger = logging.getLogger(__name__)
 
-    def start(self) -> None:
-        """Start the Pyrogram client session. Call once before batch uploads."""
+    def _run(self, coro):
+        """
+        Run a coroutine on the client's loop and return its result.
+        
+        If the wait is interrupted (e.g. Ctrl+C), the task is cancelled and
+        unwound before the exception propagates, so nothing is left pending on
+        the loop.
+        """
+        task = self._loop.create_task(coro)
+        try:
+            return self._loop.run_until_complete(task)
+        except BaseException:
+            if not task.done():
+                task.cancel()
+                try:
+                    self._loop.run_until_complete(task)
+                except BaseException:
+                    pass
+            raise
+
+    async def start_async(self) -> None:
+        """Start the Pyrogram client session. Safe to call repeatedly."""
         if not self._started:
-            self.app.start()
+            await self.app.start()
             self._started = True
 
-    def stop(self) -> None:
-        """Stop the Pyrogram client session. Call once after batch uploads."""
+    async def stop_async(self) -> None:
+        """Stop the Pyrogram client session. Safe to call repeatedly."""
         if self._started:
-            self.app.stop()
             self._started = False
+            await self.app.stop()
 
-    def __enter__(self):
-        self.start()
-        return self
+    def start(self) -> None:
+        """Sync wrapper around start_async."""
+        self._run(self.start_async())
 
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.stop()
-        return False
+    def stop(self) -> None:
+        """Sync wrapper around stop_async."""
+        self._run(self.stop_async())
+
+    def close(self) -> None:
+        """
+        Stop the session kept open by upload_to_telegram and close its event
+        loop. Call once at exit; the uploader cannot be used afterwards.
+        """
+        try:
+            self.stop()
+        finally:
+            self._loop.close()
 
     def upload_to_telegram(self, download_result: DownloadResult, progress_callback=None, status_callback: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Upload video to Telegram channel, blocking until done. Sync wrapper
+        around upload_async; takes the same arguments.
+        
+        If the upload fails or is interrupted, the session is stopped: a
+        cancelled send can leave transfers behind on it. The next upload starts
+        a fresh one.
+        """
+        try:
+            return self._run(self.upload_async(download_result, progress_callback, status_callback))
+        except BaseException:
+            try:
+                self.stop()
+            except Exception as e:
+                self.logger.warning(f"Could not stop Telegram session: {e}")
+            raise
+
+    async def upload_async(self, download_result: DownloadResult, progress_callback=None, status_callback: Optional[Callable[[str], None]] = None) -> bool:
         """
         Upload video to Telegram channel.
         
-        If the client was started externally (via start() or context manager),
-        reuses that session. Otherwise starts and stops for this single upload.
+        The client session is started on first use and kept open for later
+        uploads, so authorization and DC setup are paid once per run rather
+        than once per video. close() ends it.
         
         Handles FloodWait by sleeping the requested number of seconds and
         retrying, up to MAX_FLOOD_WAIT_RETRIES attempts. Longer waits than
         MAX_FLOOD_WAIT_SEC abort immediately.
         
         :param download_result: DownloadResult with video path and metadata
-        :param progress_callback: Optional callback(current_bytes, total_bytes) for upload progress
+        :param progress_callback: Optional callback(current_bytes, total_bytes) for upload progress,
+            run on the client's executor thread
         :param status_callback: Optional callback(message: str) for status messages shown to the user
         """
         if not os.path.exists(download_result.video_path):
@@ -79,56 +137,48 @@ class TelegramUploader:
             if status_callback:
                 status_callback(msg)
         
-        # If session wasn't started externally, manage it for this single call
-        manage_session = not self._started
+        await self.start_async()
         
         attempt = 0
-        try:
-            if manage_session:
-                self.start()
-            
-            while True:
-                attempt += 1
-                try:
-                    kwargs = {
-                        'chat_id': self.channel_id,
-                        'video': download_result.video_path,
-                        'caption': download_result.video_title,
-                        'duration': download_result.duration
-                    }
-                    
-                    if download_result.thumbnail_path and os.path.exists(download_result.thumbnail_path):
-                        kwargs['thumb'] = download_result.thumbnail_path
-                    
-                    if progress_callback:
-                        kwargs['progress'] = progress_callback
-                    
-                    self.app.send_video(**kwargs)
-                    return True
+        while True:
+            attempt += 1
+            try:
+                kwargs = {
+                    'chat_id': self.channel_id,
+                    'video': download_result.video_path,
+                    'caption': download_result.video_title,
+                    'duration': download_result.duration
+                }
                 
-                except FloodWait as e:
-                    # Pyrogram v2 renamed .x → .value; support both.
-                    wait = getattr(e, 'value', None) or getattr(e, 'x', None)
-                    if wait is None:
-                        raise
-                    if wait > config.max_flood_wait_sec:
-                        raise RuntimeError(
-                            f"FloodWait {wait}s exceeds {config.max_flood_wait_sec}s limit — aborting"
-                        ) from e
-                    if attempt > config.max_flood_wait_retries:
-                        raise RuntimeError(
-                            f"FloodWait retried {config.max_flood_wait_retries} times — giving up (last wait {wait}s)"
-                        ) from e
-                    
-                    self.logger.warning(f"FloodWait {wait}s, attempt {attempt}/{config.max_flood_wait_retries}")
-                    _status(f"Telegram requests {wait}s wait (attempt {attempt}/{config.max_flood_wait_retries}). Sleeping...")
-                    time.sleep(wait + 1)
-                    # loop and retry the same send_video
+                if download_result.thumbnail_path and os.path.exists(download_result.thumbnail_path):
+                    kwargs['thumb'] = download_result.thumbnail_path
                 
-                except Exception as e:
-                    self.logger.error(f"Upload failed: {e}")
-                    raise RuntimeError(f"Failed to upload to Telegram: {e}") from e
-        finally:
-            if manage_session:
-                self.stop()
+                if progress_callback:
+                    kwargs['progress'] = progress_callback
+                
+                await self.app.send_video(**kwargs)
+                return True
+            
+            except FloodWait as e:
+                # Pyrogram v2 renamed .x → .value; support both.
+                wait = getattr(e, 'value', None) or getattr(e, 'x', None)
+                if wait is None:
+                    raise
+                if wait > config.max_flood_wait_sec:
+                    raise RuntimeError(
+                        f"FloodWait {wait}s exceeds {config.max_flood_wait_sec}s limit — aborting"
+                    ) from e
+                if attempt > config.max_flood_wait_retries:
+                    raise RuntimeError(
+                        f"FloodWait retried {config.max_flood_wait_retries} times — giving up (last wait {wait}s)"
+                    ) from e
+                
+                self.logger.warning(f"FloodWait {wait}s, attempt {attempt}/{config.max_flood_wait_retries}")
+                _status(f"Telegram requests {wait}s wait (attempt {attempt}/{config.max_flood_wait_retries}). Sleeping...")
+                await asyncio.sleep(wait + 1)
+                # loop and retry the same send_video
+            
+            except Exception as e:
+                self.logger.error(f"Upload failed: {e}")
+                raise RuntimeError(f"Failed to upload to Telegram: {e}") from e
 
@@ -1,4 +1,7 @@
+import re
+from concurrent.futures import Future
 from contextlib import contextmanager
+from typing import Optional, List, Tuple
 
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
@@ -16,7 +19,7 @@ from rich.progress import (
     TaskID,
 )
 
-from src.models import VideoInfo
+from src.models import VideoInfo, DownloadResult
 from src.config import config
 from src.utils.helpers import format_size
 
@@ -97,9 +100,10 @@ def prompt_continue() -> bool:
 def prompt_container_format() -> str:
     """
     Show the container-format menu (mp4 / mkv / webm) and return the chosen format.
-    mp4 is recommended and selected by default.
+    mp4 is recommended and selected by default. Accepts the menu number or the
+    container name itself (e.g. "mkv").
     """
-    valid_containers = list(config.valid_containers)
+    valid_containers = config.valid_containers
     console.print("\n[bold]Available container formats:[/bold]")
     for i, container in enumerate(valid_containers, 1):
         marker = " [bold green]★ Recommended[/bold green]" if i == 1 else ""
@@ -109,17 +113,19 @@ def prompt_container_format() -> str:
         container_choice = Prompt.ask(
             "\n[bold]Select container format[/bold] [dim](Enter = recommended)[/dim]",
             default="1", show_default=False,
-        ).strip()
-        try:
+        ).strip().lower()
+        if container_choice in valid_containers:
+            console.print(f"[green]✓ Container:[/green] {container_choice}")
+            return container_choice
+        if container_choice.isdecimal():
             idx = int(container_choice) - 1
             if 0 <= idx < len(valid_containers):
                 chosen = valid_containers[idx]
                 console.print(f"[green]✓ Container:[/green] {chosen}")
                 return chosen
-            else:
-                console.print(f"[red]Please enter a number between 1 and {len(valid_containers)}[/red]")
-        except ValueError:
-            console.print("[red]Please enter a valid number[/red]")
+        console.print(
+            f"[red]Enter 1-{len(valid_containers)} or {'/'.join(valid_containers)}[/red]"
+        )
 
 def make_download_hook(progress: Progress, task_id: TaskID):
     """Create a yt-dlp progress_hook callback that drives a Rich progress bar."""
@@ -223,21 +229,20 @@ def display_video_formats(formats: VideoInfo) -> tuple:
     
     # Video Selection
     while True:
-        video_choice = Prompt.ask("Select video format", default="1")
-        try:
-            idx = int(video_choice) - 1
-            if 0 <= idx < len(unique_video_formats):
-                selected_video = unique_video_formats[idx]
-                quality = f"{selected_video['resolution']}p"
-                if selected_video['fps']:
-                    quality += f"@{selected_video['fps']}fps"
-                size_label = format_size(selected_video['size_mb'], rich=True)
-                console.print(f"[green]✓ Selected Video:[/green] {quality} ({selected_video['vcodec']}, {size_label})")
-                break
-            else:
-                console.print(f"[red]Please enter a number between 1 and {len(unique_video_formats)}[/red]")
-        except ValueError:
+        video_choice = Prompt.ask("Select video format", default="1").strip()
+        if not video_choice.isdecimal():
             console.print("[red]Please enter a valid number.[/red]")
+            continue
+        idx = int(video_choice) - 1
+        if 0 <= idx < len(unique_video_formats):
+            selected_video = unique_video_formats[idx]
+            quality = f"{selected_video['resolution']}p"
+            if selected_video['fps']:
+                quality += f"@{selected_video['fps']}fps"
+            size_label = format_size(selected_video['size_mb'], rich=True)
+            console.print(f"[green]✓ Selected Video:[/green] {quality} ({selected_video['vcodec']}, {size_label})")
+            break
+        console.print(f"[red]Please enter a number between 1 and {len(unique_video_formats)}[/red]")
             
     # Audio Table
     selected_audio = None
@@ -267,25 +272,30 @@ def display_video_formats(formats: VideoInfo) -> tuple:
         console.print(a_table)
         
         while True:
-            audio_choice = Prompt.ask("Select audio format", default="1")
-            try:
-                idx = int(audio_choice) - 1
-                if 0 <= idx < len(unique_audio_formats):
-                    selected_audio = unique_audio_formats[idx]
-                    size_label = format_size(selected_audio.get('size_mb', 0), rich=True)
-                    console.print(f"[green]✓ Selected Audio:[/green] {selected_audio['bitrate']:.0f} kbps ({selected_audio['acodec']}, {size_label})")
-                    break
-                else:
-                    console.print(f"[red]Please enter a number between 1 and {len(unique_audio_formats)}[/red]")
-            except ValueError:
+            audio_choice = Prompt.ask("Select audio format", default="1").strip()
+            if not audio_choice.isdecimal():
                 console.print("[red]Please enter a valid number.[/red]")
+                continue
+            idx = int(audio_choice) - 1
+            if 0 <= idx < len(unique_audio_formats):
+                selected_audio = unique_audio_formats[idx]
+                size_label = format_size(selected_audio.get('size_mb', 0), rich=True)
+                console.print(f"[green]✓ Selected Audio:[/green] {selected_audio['bitrate']:.0f} kbps ({selected_audio['acodec']}, {size_label})")
+                break
+            console.print(f"[red]Please enter a number between 1 and {len(unique_audio_formats)}[/red]")
     else:
         console.print("\n[yellow]⚠ No separate audio formats found (audio may be included in video stream).[/yellow]")
         
     return selected_video, selected_audio
 
 
-def download_with_progress(downloader, url, video_format, audio_format, container_format):
+def make_download_progress() -> Tuple[Progress, TaskID]:
+    """
+    Build the download progress bar and its task without starting the live display.
+
+    A background download can drive the bar through make_download_hook() while it
+    is hidden; wait_for_download() renders it once the user reaches that entry.
+    """
     progress = Progress(
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
@@ -295,14 +305,23 @@ def download_with_progress(downloader, url, video_format, audio_format, containe
         TextColumn("[yellow]{task.fields[yt_eta]}"),
         console=console,
     )
+    task_id = progress.add_task("[cyan]↓ Video", total=None, yt_speed="", yt_eta="")
+    return progress, task_id
+
+def download_with_progress(downloader, url, video_format, audio_format, container_format):
+    progress, task_id = make_download_progress()
     with progress:
-        task_id = progress.add_task("[cyan]↓ Video", total=None, yt_speed="", yt_eta="")
         result = downloader.download_video(
             url, video_format, audio_format, container_format,
             progress_hook=make_download_hook(progress, task_id)
         )
     return result
 
+def wait_for_download(progress: Progress, future: Future) -> DownloadResult:
+    """Show the progress bar of a background download until its future resolves."""
+    with progress:
+        return future.result()
+
 def upload_with_progress(uploader, download_result):
     progress = Progress(
         TextColumn("[progress.description]{task.description}"),
@@ -379,6 +398,34 @@ def prompt_failure_action(title: str, error_message: str, *, default_skip: bool
         console.print("[red]Please enter 1, 2, 3, or 4.[/red]")
 
 
+_SELECTION_PART_RE = re.compile(r'^(\d+)(?:\s*-\s*(\d+))?$')
+
+
+def _parse_selection(selection_input: str, count: int) -> Optional[List[int]]:
+    """
+    Parse a '1,3-5' style selection into sorted, unique 0-based indices.
+
+    Every part is bounds-checked before its range is expanded into a byte mask,
+    so input like '1-99999999' is rejected instead of materialised.
+
+    :param selection_input: comma-separated 1-based indices and 'a-b' ranges
+    :param count: number of selectable entries
+    :return: the indices, or None if any part is out of range (or a reversed range)
+    :raises ValueError: if a part is not a number or a range
+    """
+    selected = bytearray(count)
+    for part in selection_input.split(','):
+        match = _SELECTION_PART_RE.match(part.strip())
+        if not match:
+            raise ValueError(f"Invalid selection part: {part!r}")
+        start = int(match.group(1))
+        end = int(match.group(2) or start)
+        if not 1 <= start <= end <= count:
+            return None
+        selected[start - 1:end] = b'\x01' * (end - start + 1)
+    return [i for i, flag in enumerate(selected) if flag]
+
+
 def prompt_playlist_selection(playlist_entries: list) -> list:
     """
     Display numbered playlist entries and let the user select which to process.
@@ -403,17 +450,8 @@ def prompt_playlist_selection(playlist_entries: list) -> list:
             return playlist_entries
 
         try:
-            selected_indices = []
-            parts = selection_input.split(',')
-            for part in parts:
-                part = part.strip()
-                if '-' in part:
-                    start, end = map(int, part.split('-'))
-                    selected_indices.extend(range(start - 1, end))
-                else:
-                    selected_indices.append(int(part) - 1)
-            selected_indices = sorted(set(selected_indices))
-            if all(0 <= idx < len(playlist_entries) for idx in selected_indices):
+            selected_indices = _parse_selection(selection_input, len(playlist_entries))
+            if selected_indices is not None:
                 return [playlist_entries[i] for i in selected_indices]
             else:
                 console.print("[red]Invalid indices. Please try again.[/red]")
@@ -7,8 +7,12 @@ retry-on-failure, per-attempt cleanup, and end-of-run summary.
 main.py is the thin entry point that owns one-time setup (env vars, JS runtime
 warning, cookies prompt, session loop) and delegates each iteration to run_session().
 """
-from typing import Optional, List, Tuple, Protocol
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, List, Tuple, Dict, Callable, Protocol
 from rich.panel import Panel
+from rich.progress import Progress, TaskID
 from rich.prompt import Confirm, IntPrompt
 
 from src.models import DownloadResult
@@ -17,6 +21,9 @@ from src.ui.cli import (
     console,
     display_video_formats,
     download_with_progress,
+    make_download_progress,
+    make_download_hook,
+    wait_for_download,
     upload_with_progress,
     prompt_failure_action,
     prompt_mode,
@@ -37,6 +44,27 @@ from src.utils.helpers import (
 )
 
 
+# ---------------------------------------------------------------------------
+#  Background prefetch state
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Prefetch:
+    """
+    Download of the next playlist/batch entry, started while the current one uploads.
+
+    match_future is the entry's metadata future and resolves to
+    (formats, matched_video, matched_audio); download_future resolves to a
+    DownloadResult with the thumbnail already converted, or None when the entry
+    will be skipped (no match / over the limit).
+    """
+    match_future: Future
+    download_future: Future
+    progress: Progress
+    task_id: TaskID
+    cancel: threading.Event
+
+
 # ---------------------------------------------------------------------------
 #  Closure type hints (Protocol)
 #
@@ -53,6 +81,9 @@ class AttemptFn(Protocol):
         url: str,
         video_format_id: str,
         audio_format_id: Optional[str],
+        *,
+        prefetched: Optional[_Prefetch] = None,
+        on_downloaded: Optional[Callable[[], None]] = None,
     ) -> DownloadResult: ...
 
 
@@ -66,6 +97,8 @@ class RunWithRetryFn(Protocol):
         title: str,
         *,
         default_skip: bool = False,
+        prefetched: Optional[_Prefetch] = None,
+        on_downloaded: Optional[Callable[[], None]] = None,
     ) -> str: ...
 
 
@@ -88,6 +121,17 @@ def run_session(downloader: YouTubeTelegramDownloader, uploader: TelegramUploade
 #  Shared helpers
 # ---------------------------------------------------------------------------
 
+def _fetch_formats_in_background(downloader: YouTubeTelegramDownloader, url: str) -> Future:
+    """
+    Start get_video_qualities(url) on a worker thread so the fetch overlaps the
+    next prompt. The returned future raises whatever the fetch raised.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(downloader.get_video_qualities, url)
+    executor.shutdown(wait=False)  # worker exits once the fetch completes
+    return future
+
+
 def _confirm_size(estimated_size: float, max_size_mb: float = 2048) -> bool:
     """Show size estimate, prompt for proceed if over limit. Returns False if user aborts."""
     if estimated_size <= 0:
@@ -109,11 +153,31 @@ def _confirm_size(estimated_size: float, max_size_mb: float = 2048) -> bool:
 
 def _make_attempt_one(downloader, uploader, container_format) -> AttemptFn:
     """Build a per-attempt download+upload closure bound to the session's deps."""
-    def _attempt_one(url_to_use: str, v_fmt_id: str, a_fmt_id: Optional[str]) -> DownloadResult:
-        result = download_with_progress(downloader, url_to_use, v_fmt_id, a_fmt_id, container_format)
-        console.print(f"[green]✓ Downloaded:[/green] {result.video_title} ({result.duration}s)")
-        if result.thumbnail_path:
-            result.thumbnail_path = convert_thumbnail(result.thumbnail_path)
+    def _attempt_one(
+        url_to_use: str,
+        v_fmt_id: str,
+        a_fmt_id: Optional[str],
+        *,
+        prefetched: Optional[_Prefetch] = None,
+        on_downloaded: Optional[Callable[[], None]] = None,
+    ) -> DownloadResult:
+        if prefetched is not None:
+            # Thumbnail was already converted by the background worker.
+            try:
+                result = wait_for_download(prefetched.progress, prefetched.download_future)
+            except BaseException:
+                # Nothing tracks this prefetch any more: on Ctrl+C stop the worker and
+                # remove its files here instead of letting shutdown wait for it.
+                _discard_prefetch(prefetched)
+                raise
+            console.print(f"[green]✓ Downloaded:[/green] {result.video_title} ({result.duration}s)")
+        else:
+            result = download_with_progress(downloader, url_to_use, v_fmt_id, a_fmt_id, container_format)
+            console.print(f"[green]✓ Downloaded:[/green] {result.video_title} ({result.duration}s)")
+            if result.thumbnail_path:
+                result.thumbnail_path = convert_thumbnail(result.thumbnail_path)
+        if on_downloaded:
+            on_downloaded()
         upload_with_progress(uploader, result)
         console.print("[green]✓ Upload successful![/green]")
         return result
@@ -125,6 +189,7 @@ def _make_run_with_retry(downloader, uploader, container_format) -> RunWithRetry
     Build a _run_with_retry closure bound to session deps.
     Returns a function(url, v_id, a_id, title, default_skip) -> 'ok' | 'skipped' | 'aborted'.
     Each attempt cleans up its own DownloadResult before any retry/return.
+    A prefetched download is only used for the first attempt; retries download again.
     """
     _attempt_one = _make_attempt_one(downloader, uploader, container_format)
 
@@ -135,13 +200,19 @@ def _make_run_with_retry(downloader, uploader, container_format) -> RunWithRetry
         title_label: str,
         *,
         default_skip: bool = False,
+        prefetched: Optional[_Prefetch] = None,
+        on_downloaded: Optional[Callable[[], None]] = None,
     ) -> str:
         v_id = cur_video_format
         a_id = cur_audio_format
         while True:
             local_result = None
+            attempt_prefetch, prefetched = prefetched, None
             try:
-                local_result = _attempt_one(url_to_use, v_id, a_id)
+                local_result = _attempt_one(
+                    url_to_use, v_id, a_id,
+                    prefetched=attempt_prefetch, on_downloaded=on_downloaded,
+                )
                 cleanup(local_result)
                 return "ok"
             except Exception as e:
@@ -177,6 +248,59 @@ def _make_run_with_retry(downloader, uploader, container_format) -> RunWithRetry
 #  Shared processing loop for playlist & batch modes
 # ---------------------------------------------------------------------------
 
+def _fetch_and_match(downloader: YouTubeTelegramDownloader, entry_url: str, preferred_video, preferred_audio):
+    """Fetch an entry's formats and match them to the user-selected quality."""
+    entry_formats = downloader.get_video_qualities(entry_url)
+    matched_video = YouTubeTelegramDownloader.match_video_format(
+        entry_formats['video_formats'], preferred_video
+    )
+    matched_audio = YouTubeTelegramDownloader.match_audio_format(
+        entry_formats['audio_formats'], preferred_audio
+    )
+    return entry_formats, matched_video, matched_audio
+
+
+def _prefetch_download(
+    downloader: YouTubeTelegramDownloader,
+    entry_url: str,
+    match_future: Future,
+    container_format: str,
+    max_size_mb: int,
+    progress_hook,
+    cancel: threading.Event,
+) -> Optional[DownloadResult]:
+    """
+    Background half of a _Prefetch: download the matched formats unless the
+    foreground would skip the entry. Mirrors the skip rules in _process_entries.
+    """
+    entry_formats, matched_video, matched_audio = match_future.result()
+    if cancel.is_set() or not matched_video:
+        return None
+    v_id = matched_video['format_id']
+    a_id = matched_audio['format_id'] if matched_audio else None
+    estimated_size = YouTubeTelegramDownloader.estimate_size(
+        entry_formats['video_formats'], entry_formats['audio_formats'], v_id, a_id,
+    )
+    if estimated_size > max_size_mb:
+        return None
+    result = downloader.download_video(entry_url, v_id, a_id, container_format, progress_hook=progress_hook)
+    if result.thumbnail_path:
+        result.thumbnail_path = convert_thumbnail(result.thumbnail_path)
+    return result
+
+
+def _discard_prefetch(prefetch: _Prefetch) -> None:
+    """Cancel a prefetch that will not be consumed and remove anything it downloaded."""
+    prefetch.cancel.set()
+    prefetch.download_future.cancel()
+    try:
+        result = prefetch.download_future.result()
+    except Exception:
+        return  # cancelled or failed — download_video already removed its partial files
+    if result:
+        cleanup(result)
+
+
 def _process_entries(
     entries: List[Tuple[str, str]],
     downloader: YouTubeTelegramDownloader,
@@ -191,6 +315,16 @@ def _process_entries(
     """
     Download+upload a list of entries, matching each one to the user-selected quality.
 
+    Formats are fetched ahead of the current entry by a small thread pool
+    (config.metadata_workers), so per-entry metadata round-trips overlap instead
+    of running one by one. The look-ahead is bounded so fetched metadata is still
+    in the downloader's cache (and fresh) when its entry downloads. While an
+    entry uploads, a single background worker downloads the next one, so the
+    YouTube and Telegram legs overlap too. At most one entry is prefetched, so no
+    more than two downloads sit on disk at once. Failures in the background
+    surface when the entry is reached and go through the usual retry/skip/abort
+    menu.
+
     :param entries: list of (url, display_title) tuples
     :param preferred_video: reference video format chosen from the first entry
     :param preferred_audio: reference audio format chosen from the first entry
@@ -203,7 +337,52 @@ def _process_entries(
     skipped = 0
     summary_rows: list = []
 
-    with uploader:
+    metadata_pool = ThreadPoolExecutor(max_workers=config.metadata_workers)
+    match_futures: List[Future] = []
+    lookahead = 2 * config.metadata_workers  # keeps every worker busy one round ahead
+    executor = ThreadPoolExecutor(max_workers=1)
+    prefetched: Dict[int, _Prefetch] = {}
+
+    def _fill_metadata_window(pos: int) -> None:
+        """Make sure fetches are submitted for entries[pos:pos + lookahead] (0-based)."""
+        for entry_url, _ in entries[len(match_futures):pos + lookahead]:
+            match_futures.append(metadata_pool.submit(
+                _fetch_and_match, downloader, entry_url, preferred_video, preferred_audio,
+            ))
+
+    def _schedule_prefetch(pos: int) -> None:
+        """Start the background download of entries[pos] (0-based), once."""
+        if pos >= len(entries) or pos in prefetched:
+            return
+        if pos > 0 and YouTubeTelegramDownloader.same_video(entries[pos - 1][0], entries[pos][0]):
+            # Same file name as the entry still uploading: yt-dlp would reuse that file and
+            # its cleanup would delete it. Download in the foreground after cleanup instead.
+            return
+        _fill_metadata_window(pos)
+        entry_url = entries[pos][0]
+        progress, task_id = make_download_progress()
+        cancel = threading.Event()
+        download_hook = make_download_hook(progress, task_id)
+
+        def _hook(d):
+            if cancel.is_set():
+                raise RuntimeError("Background download cancelled")
+            download_hook(d)
+
+        match_future = match_futures[pos]
+        download_future = executor.submit(
+            _prefetch_download, downloader, entry_url, match_future,
+            container_format, max_size_mb, _hook, cancel,
+        )
+        prefetched[pos] = _Prefetch(match_future, download_future, progress, task_id, cancel)
+
+    def _drop_prefetch(pos: int) -> None:
+        """Discard the prefetch of entries[pos] (0-based), if there is one."""
+        pending = prefetched.pop(pos, None)
+        if pending is not None:
+            _discard_prefetch(pending)
+
+    try:
         for idx, (entry_url, entry_title) in enumerate(entries, 1):
             console.print(Panel(
                 f"[bold]{entry_title}[/bold]",
@@ -213,61 +392,70 @@ def _process_entries(
 
             quality_label = "?"
             size_label = "?"
+            _fill_metadata_window(idx - 1)
+            match_future: Optional[Future] = match_futures[idx - 1]
+            # The entry's prefetch stays in `prefetched` until it is handed to
+            # _run_with_retry, so the finally below still discards it if we are
+            # interrupted while matching formats.
 
             # Outer while-loop allows retrying format-fetch failures.
             while True:
                 try:
                     with spinner("[bold cyan]Matching formats..."):
-                        entry_formats = downloader.get_video_qualities(entry_url)
-                        matched_video = YouTubeTelegramDownloader.match_video_format(
-                            entry_formats['video_formats'], preferred_video
+                        if match_future is not None:
+                            entry_formats, matched_video, matched_audio = match_future.result()
+                        else:
+                            entry_formats, matched_video, matched_audio = _fetch_and_match(
+                                downloader, entry_url, preferred_video, preferred_audio,
+                            )
+
+                    # Buffer the status lines so they reach the terminal in one write.
+                    with console:
+                        if not matched_video:
+                            console.print("[yellow]⚠ Skipped:[/yellow] no video formats available")
+                            skipped += 1
+                            summary_rows.append({"title": entry_title, "quality": "-", "size": "-", "status": "skipped"})
+                            break
+
+                        v_id = matched_video['format_id']
+                        a_id = matched_audio['format_id'] if matched_audio else None
+
+                        fps = matched_video.get('fps') or 0
+                        fps_part = f"@{int(fps)}fps" if fps else ""
+                        quality_label = (
+                            f"{matched_video['resolution']}p{fps_part} "
+                            f"{matched_video.get('vcodec', '')}"
                         )
-                        matched_audio = YouTubeTelegramDownloader.match_audio_format(
-                            entry_formats['audio_formats'], preferred_audio
-                        )
-
-                    if not matched_video:
-                        console.print("[yellow]⚠ Skipped:[/yellow] no video formats available")
-                        skipped += 1
-                        summary_rows.append({"title": entry_title, "quality": "-", "size": "-", "status": "skipped"})
-                        break
-
-                    v_id = matched_video['format_id']
-                    a_id = matched_audio['format_id'] if matched_audio else None
 
-                    fps = matched_video.get('fps') or 0
-                    fps_part = f"@{int(fps)}fps" if fps else ""
-                    quality_label = (
-                        f"{matched_video['resolution']}p{fps_part} "
-                        f"{matched_video.get('vcodec', '')}"
-                    )
-
-                    if v_id != preferred_video['format_id']:
-                        console.print(f"[dim]Matched format:[/dim] {quality_label}")
-                    else:
-                        console.print(f"[dim]Format:[/dim] {quality_label}")
-
-                    estimated_size = YouTubeTelegramDownloader.estimate_size(
-                        entry_formats['video_formats'],
-                        entry_formats['audio_formats'],
-                        v_id, a_id,
-                    )
+                        if v_id != preferred_video['format_id']:
+                            console.print(f"[dim]Matched format:[/dim] {quality_label}")
+                        else:
+                            console.print(f"[dim]Format:[/dim] {quality_label}")
 
-                    if estimated_size > max_size_mb:
-                        console.print(
-                            f"[yellow]⚠ Skipped:[/yellow] estimated "
-                            f"{format_size(estimated_size)} > {format_size(max_size_mb)} limit"
+                        estimated_size = YouTubeTelegramDownloader.estimate_size(
+                            entry_formats['video_formats'],
+                            entry_formats['audio_formats'],
+                            v_id, a_id,
                         )
-                        skipped += 1
-                        summary_rows.append({"title": entry_title, "quality": quality_label, "size": format_size(estimated_size), "status": "skipped"})
-                        break
 
-                    console.print(format_size_status(estimated_size, max_size_mb))
-                    size_label = format_size(estimated_size)
+                        if estimated_size > max_size_mb:
+                            console.print(
+                                f"[yellow]⚠ Skipped:[/yellow] estimated "
+                                f"{format_size(estimated_size)} > {format_size(max_size_mb)} limit"
+                            )
+                            skipped += 1
+                            summary_rows.append({"title": entry_title, "quality": quality_label, "size": format_size(estimated_size), "status": "skipped"})
+                            break
+
+                        console.print(format_size_status(estimated_size, max_size_mb))
+                        size_label = format_size(estimated_size)
 
+                    attempt_prefetch = prefetched.pop(idx - 1, None)
                     outcome = _run_with_retry(
                         entry_url, v_id, a_id, entry_title,
                         default_skip=True,
+                        prefetched=attempt_prefetch,
+                        on_downloaded=lambda: _schedule_prefetch(idx),
                     )
                     if outcome == "ok":
                         successful_uploads += 1
@@ -282,6 +470,9 @@ def _process_entries(
                     break  # success or skip — move to next entry
 
                 except Exception as e:
+                    # Failed background work is not reused: a retry fetches in the foreground.
+                    match_future = None
+                    _drop_prefetch(idx - 1)
                     action = prompt_failure_action(entry_title, str(e), default_skip=True)
                     if action == "retry":
                         continue  # retry format fetch
@@ -301,6 +492,16 @@ def _process_entries(
                         summary_rows.append({"title": entry_title, "quality": quality_label, "size": size_label, "status": "failed"})
                         return successful_uploads, skipped, summary_rows
 
+            # Entry was skipped before its prefetched download was used.
+            _drop_prefetch(idx - 1)
+    finally:
+        for future in match_futures:
+            future.cancel()  # only stops fetches that have not started yet
+        for pending in prefetched.values():
+            _discard_prefetch(pending)
+        executor.shutdown(wait=True)
+        metadata_pool.shutdown(wait=True)
+
     return successful_uploads, skipped, summary_rows
 
 
@@ -370,14 +571,16 @@ def _run_playlist_mode(downloader, uploader) -> None:
         "later videos auto-match the same resolution/fps/codec.[/dim]"
     )
 
+    first_video_url = selected_entries[0]['url']
+    formats_future = _fetch_formats_in_background(downloader, first_video_url)
+
     max_size_mb = IntPrompt.ask(
         "[bold]Enter max file size in MB[/bold]", default=config.default_max_size_mb,
     )
 
-    first_video_url = selected_entries[0]['url']
     with spinner("[bold cyan]Fetching Available Formats from first video..."):
         try:
-            formats = downloader.get_video_qualities(first_video_url)
+            formats = formats_future.result()
         except Exception as e:
             console.print(Panel(
                 f"[red]✗ ERROR: Could not read formats from the first video.[/red]\n"
@@ -407,14 +610,16 @@ def _run_batch_mode(downloader, uploader) -> None:
     if not urls:
         return
 
+    first_url = urls[0]
+    formats_future = _fetch_formats_in_background(downloader, first_url)
+
     max_size_mb = IntPrompt.ask(
         "[bold]Enter max file size in MB[/bold]", default=config.default_max_size_mb,
     )
 
-    first_url = urls[0]
     with spinner("[bold cyan]Fetching Available Formats from first URL..."):
         try:
-            formats = downloader.get_video_qualities(first_url)
+            formats = formats_future.result()
         except Exception as e:
             console.print(Panel(
                 f"[red]✗ ERROR: Could not read formats from the first URL.[/red]\n"
@@ -1,10 +1,22 @@
 import os
 import logging
 import subprocess
-from typing import Optional
+from typing import Optional, Dict, Collection
 
 from src.models import DownloadResult
 
+logger = logging.getLogger(__name__)
+
+# Pillow is optional; convert_thumbnail falls back to FFmpeg without it.
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Telegram rejects thumbnails of 200 kB or more.
+_MAX_THUMBNAIL_BYTES = 200_000
+
+
 def convert_thumbnail(input_thumbnail: str) -> Optional[str]:
     """
     Convert thumbnail to JPEG format for Telegram.
@@ -14,63 +26,92 @@ def convert_thumbnail(input_thumbnail: str) -> Optional[str]:
     if not input_thumbnail or not os.path.exists(input_thumbnail):
         return None
     
-    output_thumbnail = input_thumbnail.rsplit('.', 1)[0] + '.jpg'
+    base, ext = os.path.splitext(input_thumbnail)
+    if ext.lower() in ('.jpg', '.jpeg') and os.path.getsize(input_thumbnail) < _MAX_THUMBNAIL_BYTES:
+        return input_thumbnail  # already a usable JPEG; re-encoding would only lose quality
+    
+    output_thumbnail = base + '.jpg'
     
     try:
         # Try PIL first
-        try:
-            from PIL import Image
+        if Image is not None:
             with Image.open(input_thumbnail) as img:
                 img.convert('RGB').save(output_thumbnail, 'JPEG')
             return output_thumbnail
-        except ImportError:
-            logging.getLogger(__name__).info("PIL not available, trying FFmpeg")
+        logger.info("PIL not available, trying FFmpeg")
         
         # Use FFmpeg as fallback
         try:
+            # Output is never read, so discard it rather than buffering it in pipes.
             subprocess.run(
-                ['ffmpeg', '-y', '-i', input_thumbnail, output_thumbnail],
+                ['ffmpeg', '-loglevel', 'error', '-y', '-i', input_thumbnail,
+                 '-frames:v', '1', output_thumbnail],
                 check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
             return output_thumbnail
         except (subprocess.SubprocessError, FileNotFoundError):
             return None
             
     except Exception as e:
-        logging.getLogger(__name__).error(f"Thumbnail conversion failed: {e}")
+        logger.error(f"Thumbnail conversion failed: {e}")
         return None
 
+def find_sibling_files(base_path: str, extensions: Optional[Collection[str]] = None) -> Dict[str, str]:
+    """
+    Find files named ``<base_path>.<ext>`` with a single directory scan
+    instead of one stat call per candidate extension.
+    
+    :param base_path: Path without extension (e.g. video path minus '.mp4')
+    :param extensions: Extensions to look for, without the dot; None matches any
+        suffix (e.g. 'f137.mp4.part')
+    :return: Mapping of extension to existing file path
+    """
+    directory, prefix = os.path.split(base_path)
+    prefix += '.'
+    found = {}
+    try:
+        with os.scandir(directory or '.') as it:
+            for entry in it:
+                if not entry.name.startswith(prefix):
+                    continue
+                ext = entry.name[len(prefix):]
+                if (extensions is None or ext in extensions) and entry.is_file():
+                    found[ext] = os.path.join(directory, entry.name)
+    except OSError:
+        pass
+    return found
+
 def cleanup(download_result: DownloadResult) -> None:
     """
     Clean up downloaded files
     """
-    deleted = set()
-    try:
-        # Delete video file
-        if download_result.video_path and os.path.exists(download_result.video_path):
-            os.remove(download_result.video_path)
-            deleted.add(os.path.abspath(download_result.video_path))
-        
-        # Delete thumbnail if set
-        if download_result.thumbnail_path and os.path.exists(download_result.thumbnail_path):
-            abs_path = os.path.abspath(download_result.thumbnail_path)
-            if abs_path not in deleted:
-                os.remove(download_result.thumbnail_path)
-                deleted.add(abs_path)
-        
-        # Get base name for additional thumbnails (originals before conversion)
+    paths = [download_result.video_path, download_result.thumbnail_path]
+    if download_result.video_path:
+        # Everything else yt-dlp left under the same name: thumbnail originals from
+        # before conversion, and .part/.ytdl/.fNNN files from interrupted attempts.
         base_name = os.path.splitext(download_result.video_path)[0]
-        for ext in ['webp', 'jpg', 'png', 'jpeg']:
-            potential_thumbnail = f"{base_name}.{ext}"
-            abs_path = os.path.abspath(potential_thumbnail)
-            if abs_path not in deleted and os.path.exists(potential_thumbnail):
-                os.remove(potential_thumbnail)
-                deleted.add(abs_path)
-        
-    except Exception as e:
-        logging.getLogger(__name__).error(f"Cleanup error: {e}")
+        paths.extend(find_sibling_files(base_name).values())
+    
+    _remove_files(paths)
+
+def remove_sibling_files(base_path: str) -> None:
+    """
+    Remove every ``<base_path>.*`` file, e.g. the thumbnail and .part/.ytdl files
+    an interrupted download left behind.
+    """
+    _remove_files(find_sibling_files(base_path).values())
+
+def _remove_files(paths) -> None:
+    # Dedupe by absolute path and remove without a pre-stat: a missing file is fine.
+    for path in dict.fromkeys(os.path.abspath(p) for p in paths if p):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Cleanup error: {e}")
 
 def get_env_setup_instructions() -> str:
     """